@@ -9,8 +9,13 @@
 import eventlet
 eventlet.monkey_patch()
 
-import os, re, csv, json, time, logging
-from eventlet.queue import Queue, Empty
+import os, csv, json, time, logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+import orjson
+from eventlet import tpool
+from eventlet.event import Event
+from eventlet.queue import Empty
 from eventlet.semaphore import Semaphore
 
 from flask import Flask, request, render_template, jsonify, send_from_directory
@@ -27,9 +32,17 @@ logger = logging.getLogger("statkeeper")
 SetLogLevel(-1)  # quiet Vosk internal logs
 
 # ---- Flask / Socket.IO (Eventlet) ----
+class _OrjsonModule:
+    """json-module stand-in so Socket.IO encodes/decodes packets with orjson."""
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+    loads = staticmethod(orjson.loads)
+
 app = Flask(__name__, static_folder="static", static_url_path="/static")
 socketio = SocketIO(
     app,
+    json=_OrjsonModule,
     cors_allowed_origins="*",
     async_mode="eventlet",
     ping_timeout=60,
@@ -54,13 +67,79 @@ ROSTER = [
 # Dedupe window (seconds) for combining voice commands (requested: 4s)
 DEDUPE_WINDOW_SEC = 4.0
 
+# Number of most recent events sent to clients
+EVENTS_TAIL_MAX = 200
+
+# Partial-transcript emit throttle: at most one per MIN_INTERVAL, and only if
+# it grew by MIN_NEW_CHARS or IDLE seconds passed since the last one
+PARTIAL_MIN_INTERVAL_SEC = 0.12
+PARTIAL_MIN_NEW_CHARS = 3
+PARTIAL_IDLE_SEC = 0.4
+
+# Queued chunks are concatenated into one AcceptWaveform call of up to this many bytes
+AUDIO_BATCH_BYTES = int(SAMPLE_RATE * 2 * 0.2)  # 200ms of 16-bit mono PCM
+
+# Audio waiting for the recognizer is capped by size; oldest audio is dropped first
+AUDIO_MAX_BYTES = SAMPLE_RATE * 2 * 5  # 5s of 16-bit mono PCM
+
+# ---- Audio buffer ----
+class AudioRing:
+    """
+    Byte-budgeted FIFO of PCM chunks (Queue-like get/get_nowait/empty/qsize).
+    put() never blocks: it evicts the oldest chunks until the new one fits.
+    Methods never yield to the hub, so greenlets can't interleave inside them.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._chunks = deque()
+        self._ready = Event()  # sent while chunks are queued
+
+    def put(self, chunk):
+        """Append a chunk; returns how many old chunks were evicted to fit it."""
+        dropped = 0
+        while self._chunks and self.nbytes + len(chunk) > self.max_bytes:
+            self.nbytes -= len(self._chunks.popleft())
+            dropped += 1
+        self._chunks.append(chunk)
+        self.nbytes += len(chunk)
+        if not self._ready.ready():
+            self._ready.send()
+        return dropped
+
+    def get_nowait(self):
+        if not self._chunks:
+            raise Empty
+        chunk = self._chunks.popleft()
+        self.nbytes -= len(chunk)
+        if not self._chunks:
+            self._ready.reset()
+        return chunk
+
+    def get(self, timeout=None):
+        if not self._chunks:
+            self._ready.wait(timeout)
+        return self.get_nowait()
+
+    def empty(self):
+        return not self._chunks
+
+    def qsize(self):
+        return len(self._chunks)
+
 # ---- Globals ----
 _model = None
 REC = None
-LOCK = Semaphore(1)
-AUDIO_Q = Queue(maxsize=256)
+LOCK = Semaphore(1)  # guards recognizer creation only (single worker consumes AUDIO_Q)
+AUDIO_Q = AudioRing(AUDIO_MAX_BYTES)
 LAST_PARTIAL = ""
 
+# Debounced stats broadcast (coalesce bursts of commands into one emit)
+STATS_FLUSH_DELAY_SEC = 0.075
+_stats_dirty = False
+_flush_scheduled = False
+_FLUSH_LOCK = Semaphore(1)
+
 METRICS = {
     "chunks_enqueued": 0,
     "chunks_dropped": 0,
@@ -72,54 +151,116 @@ METRICS = {
     "disconnects": 0,
 }
 
-def ts(): return time.strftime("%H:%M:%S")
+def ts(now=None): return time.strftime("%H:%M:%S", time.localtime(now))
+
+# ---- Roster index (shared by stats, parser and grammar) ----
+@dataclass(frozen=True)
+class RosterIndex:
+    names: tuple        # lowercase, single-spaced, in roster order
+    name_set: frozenset
+    words: frozenset    # every word of every name (parser prefilter)
+    multiword: dict     # ("big", "jake") -> "big jake"
+
+    @classmethod
+    def build(cls, roster):
+        names = tuple(dict.fromkeys(" ".join(r.lower().split()) for r in roster if r.strip()))
+        return cls(
+            names=names,
+            name_set=frozenset(names),
+            words=frozenset(w for n in names for w in n.split()),
+            multiword={tuple(n.split()): n for n in names if " " in n},
+        )
+
+ROSTER_INDEX = RosterIndex.build(ROSTER)
 
 # ---- Stats model with Undo + dedupe rules + auto new point on assist ----
 class StatBook:
-    def __init__(self, roster):
-        self.roster = [r.strip().lower() for r in roster if r.strip()]
-        self._history = []
+    def __init__(self, index):
+        self.roster = list(index.names)
+        self._roster_set = index.name_set
         self._history_max = 1000
+        self._history = deque(maxlen=self._history_max)
+        self._seq = 0                   # monotonically increasing event id
         self.reset()
 
     def reset(self):
         self.game_no = 1
         self.point_no = 1
         self.events = []  # list of dicts (include ts_epoch for de-dupe)
-        self.players = {
-            n: {"ds": 0, "assists": 0, "scores": 0,
-                "throws": 0, "completions": 0, "turnovers": 0,
-                "hucks": 0, "huck_completions": 0,
-                "drops": 0}
-            for n in self.roster
-        }
-        self._history = []
+        self.events_tail = deque(maxlen=EVENTS_TAIL_MAX)  # newest first, for broadcasts
+        self.players = {n: self._blank() for n in self.roster}
+        self._history = deque(maxlen=self._history_max)
+        self._changes = []              # (player, field) bumps of the current command
         self._last_point_change = 0.0   # guard to avoid double-increment auto+manual
+        self._clear_recent()
+        self._mark_full()
 
     # --- history helpers ---
-    def _snapshot(self):
-        return {
-            "game_no": self.game_no,
-            "point_no": self.point_no,
-            "events_len": len(self.events),
-            "players": {k: dict(v) for k, v in self.players.items()},
-        }
-
+    # Undo log entries record only what a command changed:
+    #   ("stat", point_no, events_len, [(player, field), ...])  counters bumped by +1
+    #   ("game", game_no, point_no, players, events)             state replaced by new_game
     def _push_history(self):
-        self._history.append(self._snapshot())
-        if len(self._history) > self._history_max:
-            self._history.pop(0)
+        self._changes = []
+        self._history.append(("stat", self.point_no, len(self.events), self._changes))
+
+    def _push_game_history(self):
+        self._changes = []
+        self._history.append(("game", self.game_no, self.point_no,
+                              {k: dict(v) for k, v in self.players.items()}, self.events))
 
     def undo(self):
         if not self._history:
             return False
         m = self._history.pop()
-        self.game_no = m["game_no"]
-        self.point_no = m["point_no"]
-        self.players = {k: dict(v) for k, v in m["players"].items()}
-        self.events = self.events[:m["events_len"]]
+        if m[0] == "game":
+            _, self.game_no, self.point_no, self.players, self.events = m
+        else:
+            _, self.point_no, events_len, changes = m
+            for name, field in reversed(changes):
+                self.players[name][field] -= 1
+            del self.events[events_len:]
+        self.events_tail = deque(reversed(self.events[-EVENTS_TAIL_MAX:]), maxlen=EVENTS_TAIL_MAX)
+        self._reindex_recent()
+        self._mark_full()
         return True
 
+    # --- change tracking (for delta broadcasts) ---
+    def _mark_full(self):
+        """Clients need the whole table (undo / new game / reset)."""
+        self._full_dirty = True
+        self._dirty_players = set()
+        self._rows_cache = None
+
+    def _inc(self, name, field):
+        self.players[name][field] += 1
+        self._changes.append((name, field))
+        self._dirty_players.add(name)
+        self._rows_cache = None
+
+    def rows(self):
+        """Player rows sorted for display; rebuilt only after a stat changes."""
+        if self._rows_cache is None:
+            rows = [{"player": name, **stats} for name, stats in self.players.items()]
+            rows.sort(key=lambda r: (r["scores"], r["assists"], r["ds"], r["completions"], r["throws"]), reverse=True)
+            self._rows_cache = rows
+        return self._rows_cache
+
+    def take_changes(self):
+        """Return (full, dirty_players) since the last call and clear them."""
+        full, dirty = self._full_dirty, self._dirty_players
+        self._full_dirty = False
+        self._dirty_players = set()
+        return full, dirty
+
+    def events_since(self, seq):
+        """Events with seq > `seq` (at most EVENTS_TAIL_MAX), newest first."""
+        out = []
+        for ev in self.events_tail:
+            if ev["seq"] <= seq:
+                break
+            out.append(ev)
+        return out
+
     # --- small utils ---
     def _blank(self):
         return {"ds": 0, "assists": 0, "scores": 0,
@@ -128,103 +269,116 @@ class StatBook:
                 "drops": 0}
 
     def _ensure(self, name):
-        n = (name or "").lower().strip()
-        if not n: return n
-        if n not in self.players:
-            self.players[n] = self._blank()
-        return n
-
-    def _now(self):
-        return time.time()
-
-    def add_event(self, ev): self.events.append(ev)
+        """Roster key for `name`, or "" if it isn't on the roster."""
+        if name in self._roster_set:
+            return name  # parser output is already canonical
+        n = " ".join((name or "").lower().split())
+        if n in self._roster_set:
+            return n
+        if n:
+            logger.warning(f"ignoring off-roster player '{name}'")
+        return ""
+
+    def add_event(self, ev):
+        self._seq += 1
+        ev["seq"] = self._seq
+        self.events.append(ev)
+        self.events_tail.appendleft(ev)
+        self._index_recent(ev)
+
+    # --- per-player recent-event index (current point only) ---
+    def _clear_recent(self):
+        # thrower -> deque of (ts_epoch, receiver, event) for completed throws/hucks
+        self._last_completed = defaultdict(lambda: deque(maxlen=8))
+        # player -> ts_epoch of their latest assist
+        self._last_assist_ts = {}
+
+    def _index_recent(self, ev):
+        t = ev["type"]
+        if t in ("new_point", "new_game"):
+            self._clear_recent()
+        elif t in ("throw", "huck"):
+            if ev["outcome"] == "completed":
+                self._last_completed[ev["thrower"]].append((ev["ts_epoch"], ev["receiver"], ev))
+        elif t == "assist":
+            self._last_assist_ts[ev["player"]] = ev["ts_epoch"]
+
+    def _reindex_recent(self):
+        """Rebuild the index from the events of the current point (after undo)."""
+        self._clear_recent()
+        for ev in self.events:
+            self._index_recent(ev)
 
     # Return most recent completed throw/huck by X (optionally to Y) within window
-    def _find_recent_completed(self, x, y=None, within=DEDUPE_WINDOW_SEC):
-        now = self._now()
-        for ev in reversed(self.events):
-            if ev.get("game") != self.game_no or ev.get("point") != self.point_no:
-                continue
-            if ev.get("type") not in ("throw", "huck"):
+    def _find_recent_completed(self, x, now, y=None, within=DEDUPE_WINDOW_SEC):
+        recent = self._last_completed.get(x)
+        if not recent:
+            return None
+        for ts_epoch, receiver, ev in reversed(recent):
+            if y is not None and receiver != y:
                 continue
-            if ev.get("outcome") != "completed":
-                continue
-            if ev.get("thrower") != x:
-                continue
-            if y is not None and ev.get("receiver") != y:
-                continue
-            ts_epoch = ev.get("ts_epoch", now)
             if now - ts_epoch <= within:
                 return ev
-            else:
-                break  # older than window; stop scanning
+            break  # older than window; stop scanning
         return None
 
     # If an assist was just logged for X, suppress immediate follow-up throw/huck
-    def _has_recent_assist(self, x, within=DEDUPE_WINDOW_SEC):
-        now = self._now()
-        for ev in reversed(self.events):
-            if ev.get("game") != self.game_no or ev.get("point") != self.point_no:
-                continue
-            if ev.get("type") != "assist":
-                continue
-            if ev.get("player") != x:
-                continue
-            ts_epoch = ev.get("ts_epoch", now)
-            return (now - ts_epoch) <= within
-        return False
+    def _has_recent_assist(self, x, now, within=DEDUPE_WINDOW_SEC):
+        ts_epoch = self._last_assist_ts.get(x)
+        return ts_epoch is not None and (now - ts_epoch) <= within
 
     # --- control ---
-    def new_game(self):
-        self._push_history()
+    def new_game(self, *, now=None):
+        now = time.time() if now is None else now
+        self._push_game_history()
         self.game_no += 1
         self.point_no = 1
-        self.events.clear()
+        self.events = []
+        self.events_tail.clear()
         for p in self.players.values():
-            p.update({"ds": 0, "assists": 0, "scores": 0,
-                      "throws": 0, "completions": 0, "turnovers": 0,
-                      "hucks": 0, "huck_completions": 0,
-                      "drops": 0})
-        now = self._now()
+            p.update(self._blank())
+        self._mark_full()
         self._last_point_change = now
-        self.add_event({"ts_epoch": now, "t": ts(), "type": "new_game",
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "new_game",
                         "game": self.game_no, "point": self.point_no})
 
-    def new_point(self, *, push_history=True, reason="manual"):
+    def new_point(self, *, push_history=True, reason="manual", now=None):
         """
         Starts a new point:
           - If reason == "auto", we throttle so it won't trigger twice within 1s.
           - push_history=False lets us group with the preceding stat for single-step Undo.
         """
-        now = self._now()
+        now = time.time() if now is None else now
         if reason == "auto" and (now - self._last_point_change) < 1.0:
             return
         if push_history:
             self._push_history()
         self.point_no += 1
         self._last_point_change = now
-        self.add_event({"ts_epoch": now, "t": ts(), "type": "new_point",
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "new_point",
                         "game": self.game_no, "point": self.point_no})
 
     # --- events ---
-    def record_d(self, x):
+    def record_d(self, x, *, now=None):
+        now = time.time() if now is None else now
         self._push_history()
         x = self._ensure(x)
         if not x: return
-        self.players[x]["ds"] += 1
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "d",
+        self._inc(x, "ds")
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "d",
                         "player": x, "game": self.game_no, "point": self.point_no})
 
-    def record_drop(self, x):
+    def record_drop(self, x, *, now=None):
         """Increment only the 'drops' counter for player X and log an event."""
+        now = time.time() if now is None else now
         self._push_history()
         x = self._ensure(x)
         if not x: return
-        self.players[x]["drops"] += 1
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "drop",
+        self._inc(x, "drops")
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "drop",
                         "player": x, "game": self.game_no, "point": self.point_no})
 
-    def record_assist(self, x):
+    def record_assist(self, x, *, now=None):
         """
         Assist should count as:
           - Normally: assist + throw + completion
@@ -232,43 +386,45 @@ class StatBook:
               ONLY assist (+ score if we can infer receiver), NO extra throw/completion.
         Also: automatically start a NEW POINT (auto, no extra history snapshot).
         """
+        now = time.time() if now is None else now
         self._push_history()
         x = self._ensure(x)
         if not x: return
 
-        recent = self._find_recent_completed(x, y=None, within=DEDUPE_WINDOW_SEC)
+        recent = self._find_recent_completed(x, now, y=None, within=DEDUPE_WINDOW_SEC)
         if recent:
             # Only assist (and inferred score if possible)
-            self.players[x]["assists"] += 1
-            self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "assist",
+            self._inc(x, "assists")
+            self.add_event({"ts_epoch": now, "t": ts(now), "type": "assist",
                             "player": x, "game": self.game_no, "point": self.point_no})
             y = recent.get("receiver")
             if y:
-                self.players[y]["scores"] += 1
-                self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "score",
+                self._inc(y, "scores")
+                self.add_event({"ts_epoch": now, "t": ts(now), "type": "score",
                                 "player": y, "game": self.game_no, "point": self.point_no})
             # AUTO: new point
-            self.new_point(push_history=False, reason="auto")
+            self.new_point(push_history=False, reason="auto", now=now)
             return
 
         # Normal path
-        self.players[x]["assists"] += 1
-        self.players[x]["throws"] += 1
-        self.players[x]["completions"] += 1
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "assist",
+        self._inc(x, "assists")
+        self._inc(x, "throws")
+        self._inc(x, "completions")
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "assist",
                         "player": x, "game": self.game_no, "point": self.point_no})
         # AUTO: new point
-        self.new_point(push_history=False, reason="auto")
+        self.new_point(push_history=False, reason="auto", now=now)
 
-    def record_score(self, y):
+    def record_score(self, y, *, now=None):
+        now = time.time() if now is None else now
         self._push_history()
         y = self._ensure(y)
         if not y: return
-        self.players[y]["scores"] += 1
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "score",
+        self._inc(y, "scores")
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "score",
                         "player": y, "game": self.game_no, "point": self.point_no})
 
-    def record_throw(self, x, y, result):
+    def record_throw(self, x, y, result, *, now=None):
         """
         Throw:
           - always increments throws
@@ -276,24 +432,25 @@ class StatBook:
           - if turn -> turnover (no completion)
         If an assist was just logged for X within the window, we suppress this throw to avoid double counting.
         """
+        now = time.time() if now is None else now
         self._push_history()
         x = self._ensure(x); y = self._ensure(y)
         if not x or not y: return
 
-        if self._has_recent_assist(x, within=DEDUPE_WINDOW_SEC):
+        if self._has_recent_assist(x, now, within=DEDUPE_WINDOW_SEC):
             return
 
-        self.players[x]["throws"] += 1
+        self._inc(x, "throws")
         if result == "turn":
-            self.players[x]["turnovers"] += 1
+            self._inc(x, "turnovers")
         else:
-            self.players[x]["completions"] += 1
+            self._inc(x, "completions")
 
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "throw",
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "throw",
                         "thrower": x, "receiver": y, "outcome": result,
                         "game": self.game_no, "point": self.point_no})
 
-    def record_huck(self, x, y, result):
+    def record_huck(self, x, y, result, *, now=None):
         """
         Huck:
           - counts as a throw and a huck
@@ -301,26 +458,27 @@ class StatBook:
           - if turn -> turnover (no completion)
         If an assist was just logged for X within the window, we suppress this huck to avoid double counting.
         """
+        now = time.time() if now is None else now
         self._push_history()
         x = self._ensure(x); y = self._ensure(y)
         if not x or not y: return
 
-        if self._has_recent_assist(x, within=DEDUPE_WINDOW_SEC):
+        if self._has_recent_assist(x, now, within=DEDUPE_WINDOW_SEC):
             return
 
-        self.players[x]["throws"] += 1
-        self.players[x]["hucks"] += 1
+        self._inc(x, "throws")
+        self._inc(x, "hucks")
         if result == "turn":
-            self.players[x]["turnovers"] += 1
+            self._inc(x, "turnovers")
         else:
-            self.players[x]["completions"] += 1
-            self.players[x]["huck_completions"] += 1
+            self._inc(x, "completions")
+            self._inc(x, "huck_completions")
 
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "huck",
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "huck",
                         "thrower": x, "receiver": y, "outcome": result,
                         "game": self.game_no, "point": self.point_no})
 
-    def record_assist_to(self, x, y):
+    def record_assist_to(self, x, y, *, now=None):
         """
         Assist(X) + Score(Y), with dedupe:
           - If a completed throw/huck X→Y just happened within the window:
@@ -329,184 +487,196 @@ class StatBook:
               assist + throw + completion for X, and score for Y.
         AUTO: always start a NEW POINT right after.
         """
+        now = time.time() if now is None else now
         self._push_history()
         x = self._ensure(x); y = self._ensure(y)
         if not x or not y: return
 
-        recent = self._find_recent_completed(x, y=y, within=DEDUPE_WINDOW_SEC)
+        recent = self._find_recent_completed(x, now, y=y, within=DEDUPE_WINDOW_SEC)
         if recent:
-            self.players[x]["assists"] += 1
-            self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "assist",
+            self._inc(x, "assists")
+            self.add_event({"ts_epoch": now, "t": ts(now), "type": "assist",
                             "player": x, "game": self.game_no, "point": self.point_no})
-            self.players[y]["scores"] += 1
-            self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "score",
+            self._inc(y, "scores")
+            self.add_event({"ts_epoch": now, "t": ts(now), "type": "score",
                             "player": y, "game": self.game_no, "point": self.point_no})
             # AUTO: new point
-            self.new_point(push_history=False, reason="auto")
+            self.new_point(push_history=False, reason="auto", now=now)
             return
 
         # Normal path
-        self.players[x]["assists"] += 1
-        self.players[x]["throws"] += 1
-        self.players[x]["completions"] += 1
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "assist",
+        self._inc(x, "assists")
+        self._inc(x, "throws")
+        self._inc(x, "completions")
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "assist",
                         "player": x, "game": self.game_no, "point": self.point_no})
-        self.players[y]["scores"] += 1
-        self.add_event({"ts_epoch": self._now(), "t": ts(), "type": "score",
+        self._inc(y, "scores")
+        self.add_event({"ts_epoch": now, "t": ts(now), "type": "score",
                         "player": y, "game": self.game_no, "point": self.point_no})
         # AUTO: new point
-        self.new_point(push_history=False, reason="auto")
+        self.new_point(push_history=False, reason="auto", now=now)
 
-BOOK = StatBook(ROSTER)
+BOOK = StatBook(ROSTER_INDEX)
 
 # ---- Grammar & parsing ----
 RESULT_WORDS = {
     "complete": "completed", "completion": "completed", "completed": "completed",
     "turnover": "turn", "turn": "turn", "turned": "turn",
 }
-def norm_result(w):
-    return RESULT_WORDS.get((w or "").lower(), (w or "").lower()) if w else None
-
-def build_name_regex(roster):
-    pats = []
-    for n in sorted([r.strip().lower() for r in roster if r.strip()], key=len, reverse=True):
-        pats.append(re.sub(r"\s+", r"\\s+", re.escape(n)))
-    return r"(?:%s)" % "|".join(pats) if pats else r"(?:)"
-
-def build_grammar_phrases(roster):
-    roster = [r.strip().lower() for r in roster if r.strip()]
-    phrases = set()
-    phrases.update([
+_GRAMMAR_OUTCOMES = ["completed", "complete", "completion", "turn", "turnover", "turned"]
+_GRAMMAR_VERBS_THROW = ["threw", "throw", "passed"]
+_GRAMMAR_VERBS_HUCK  = ["huck", "hucked", "hook"]
+
+# single-name events
+_SINGLE_TEMPLATES = tuple(
+    "{n} " + w for w in ("d", "assist", "assists", "score", "scores", "drop", "drops")
+)
+
+# pair events (throws, hucks, bare "x to y", "x turn to y", and "x assist(s) to y")
+_PAIR_TEMPLATES = tuple(
+    # Bare "x to y" (+ optional trailing result)
+    ["{x} to {y}"] + ["{x} to {y} " + r for r in _GRAMMAR_OUTCOMES]
+    # "x turn/turnover to y" (result before 'to')
+    + ["{x} turn to {y}", "{x} turnover to {y}"]
+    # Throw / huck verbs
+    + [f"{{x}} {v} to {{y}}" + sfx
+       for v in _GRAMMAR_VERBS_THROW + _GRAMMAR_VERBS_HUCK
+       for sfx in [""] + [" " + r for r in _GRAMMAR_OUTCOMES]]
+    # Assist to
+    + ["{x} assist to {y}", "{x} assists to {y}"]
+)
+
+def build_grammar_phrases(names):
+    """All phrases the recognizer may output, for already-normalized names."""
+    phrases = {
         "new game", "new point",
         "undo", "undo last", "revert", "go back", "scratch that", "cancel last",
-    ])
-    outcomes = ["completed", "complete", "completion", "turn", "turnover", "turned"]
-    verbs_throw = ["threw", "throw", "passed"]
-    verbs_huck  = ["huck", "hucked", "hook"]
-
-    # single-name events
-    for n in roster:
-        phrases.add(f"{n} d")
-        phrases.add(f"{n} assist"); phrases.add(f"{n} assists")
-        phrases.add(f"{n} score");  phrases.add(f"{n} scores")
-        phrases.add(f"{n} drop");   phrases.add(f"{n} drops")
-
-    # pair events (throws, hucks, bare "x to y", "x turn to y", and "x assist(s) to y")
-    for x in roster:
-        for y in roster:
-            if x == y: continue
-            # Bare "x to y" (+ optional trailing result)
-            phrases.add(f"{x} to {y}")
-            for r in outcomes: phrases.add(f"{x} to {y} {r}")
-
-            # "x turn/turnover to y" (result before 'to')
-            phrases.add(f"{x} turn to {y}")
-            phrases.add(f"{x} turnover to {y}")
-
-            # Throw verbs
-            for v in verbs_throw:
-                phrases.add(f"{x} {v} to {y}")
-                for r in outcomes: phrases.add(f"{x} {v} to {y} {r}")
-
-            # Huck verbs
-            for v in verbs_huck:
-                phrases.add(f"{x} {v} to {y}")
-                for r in outcomes: phrases.add(f"{x} {v} to {y} {r}")
-
-            # Assist to
-            phrases.add(f"{x} assist to {y}")
-            phrases.add(f"{x} assists to {y}")
+    }
+    phrases.update(t.format(n=n) for n in names for t in _SINGLE_TEMPLATES)
+    phrases.update(t.format(x=x, y=y)
+                   for x in names for y in names if x != y
+                   for t in _PAIR_TEMPLATES)
     return sorted(phrases)
 
-def parse_command(text, roster_regex):
+_GRAMMAR_CACHE = {}  # tuple(sorted names) -> grammar JSON string
+
+def grammar_json_for(index):
+    """Vosk grammar JSON for a RosterIndex, built once per distinct roster."""
+    key = tuple(sorted(index.names))
+    cached = _GRAMMAR_CACHE.get(key)
+    if cached is None:
+        cached = orjson.dumps(build_grammar_phrases(key)).decode()
+        _GRAMMAR_CACHE[key] = cached
+    return cached
+
+# Token kinds for the command scanner
+_KEYWORD_KINDS = {
+    "to": "TO", "2": "TWO", "d": "D",
+    "drop": "DROP", "drops": "DROP",
+    "assist": "ASSIST", "assists": "ASSIST",
+    "score": "SCORE", "scores": "SCORE",
+    "threw": "THROW", "throw": "THROW", "passed": "THROW",
+    "huck": "HUCK", "hucked": "HUCK", "hook": "HUCK",
+    "undo": "UNDO", "revert": "UNDO",
+    **{w: "RESULT" for w in RESULT_WORDS},
+}
+_KEYWORD_PHRASES = {
+    ("go", "back"): "UNDO", ("scratch", "that"): "UNDO", ("cancel", "last"): "UNDO",
+    ("new", "game"): "NEW_GAME", ("new", "point"): "NEW_POINT",
+}
+_FILLER_WORDS = frozenset(["uh", "um", "like", "and", "then", "now", "okay", "ok", "alright"])
+
+# Command shapes, tried in this order. "x"/"y" capture a NAME, "r" a RESULT;
+# "A|B" is an alternative and a trailing "?" marks an optional token.
+_COMMAND_SHAPES = [
+    ("drop",      ["x", "DROP"]),
+    ("assist",    ["x", "ASSIST"]),
+    ("score",     ["y", "SCORE"]),
+    ("assist_to", ["x", "ASSIST", "TO", "y"]),
+    ("throw",     ["x", "r", "TO|TWO", "y"]),            # "x turn to y"
+    ("throw",     ["x", "TO|TWO", "y", "r?"]),           # bare "x to y [result]"
+    ("throw",     ["x", "THROW", "TO|TWO", "y", "r?"]),
+    ("huck",      ["x", "HUCK", "TO?", "y", "r?"]),
+]
+_ROLE_KINDS = {"x": "NAME", "y": "NAME", "r": "RESULT"}
+
+def _expand_shapes(shapes):
+    """Flatten _COMMAND_SHAPES into {kinds tuple: (action, roles tuple)}."""
+    table = {}
+    for action, shape in shapes:
+        seqs = [((), ())]
+        for el in shape:
+            optional = el.endswith("?")
+            el = el.rstrip("?")
+            alts = [(_ROLE_KINDS[el], el)] if el in _ROLE_KINDS else [(k, None) for k in el.split("|")]
+            nxt = [(kinds + (k,), roles + (role,)) for kinds, roles in seqs for k, role in alts]
+            seqs = nxt + seqs if optional else nxt
+        for kinds, roles in seqs:
+            table.setdefault(kinds, (action, roles))
+    return table
+
+_COMMAND_TABLE = _expand_shapes(_COMMAND_SHAPES)
+
+class ParserContext:
+    """Token tables for parse_command, built once per RosterIndex (rebuild if the roster changes)."""
+    def __init__(self, index):
+        # Cheap substring prefilter: every command contains one of these
+        self.TRIGGER_TOKENS = tuple(sorted(index.words | {"new", "undo", "revert", "scratch", "cancel", "go back"}))
+
+        # single tokens -> kind; multi-word names/controls -> (kind, value)
+        self.token_kind = dict(_KEYWORD_KINDS)
+        self.token_kind.update((n, "NAME") for n in index.names if " " not in n)
+        self.phrases = {k: (kind, " ".join(k)) for k, kind in _KEYWORD_PHRASES.items()}
+        self.phrases.update((parts, ("NAME", n)) for parts, n in index.multiword.items())
+        self.max_phrase = max(len(k) for k in self.phrases)
+
+    def has_trigger(self, s):
+        return any(t in s for t in self.TRIGGER_TOKENS)
+
+    def scan(self, s):
+        """Split into (kinds, values), dropping fillers and merging multi-word phrases."""
+        tokens = [t for t in s.split() if t not in _FILLER_WORDS]
+        kinds, values = [], []
+        i, n = 0, len(tokens)
+        while i < n:
+            for size in range(min(self.max_phrase, n - i), 1, -1):
+                hit = self.phrases.get(tuple(tokens[i:i + size]))
+                if hit:
+                    kinds.append(hit[0]); values.append(hit[1])
+                    i += size
+                    break
+            else:
+                t = tokens[i]
+                kinds.append(self.token_kind.get(t, "?")); values.append(t)
+                i += 1
+        return kinds, values
+
+def parse_command(text, ctx):
     s = (text or "").strip().lower()
-    s = re.sub(r"\b(uh|um|like|and|then|now|okay|ok|alright)\b", "", s).strip()
-
-    # accept if control word (new/undo) or any roster name appears
-    if not (
-        re.search(r"\bnew\s+(?:game|point)\b", s)
-        or re.search(r"\b(undo|revert|go back|scratch that|cancel last)\b", s)
-        or re.search(rf"\b{roster_regex}\b", s)
-    ):
-        return (None, {})
+    if not ctx.has_trigger(s):
+        return (None, {})  # fast path: noise / non-command speech
+    kinds, values = ctx.scan(s)
 
-    if re.search(r"\bundo\b|\brevert\b|\bgo back\b|\bscratch that\b|\bcancel last\b", s):
-        return ("undo", {})
-    if re.search(r"\bnew\s+game\b", s):  return ("new_game", {})
-    if re.search(r"\bnew\s+point\b", s): return ("new_point", {})
-
-    name_pat = roster_regex
-
-    # single-name
-    m = re.match(rf"^\s*(?P<x>{name_pat})\s+d\b", s)
-    if m: return ("d", {"x": re.sub(r"\s+", " ", m.group("x")).strip()})
-
-    m = re.match(rf"^\s*(?P<x>{name_pat})\s+drops?\b$", s)
-    if m: return ("drop", {"x": re.sub(r"\s+", " ", m.group("x")).strip()})
-
-    m = re.match(rf"^\s*(?P<x>{name_pat})\s+assists?\b$", s)
-    if m: return ("assist", {"x": re.sub(r"\s+", " ", m.group("x")).strip()})
-
-    m = re.match(rf"^\s*(?P<y>{name_pat})\s+scores?\b$", s)
-    if m: return ("score", {"y": re.sub(r"\s+", " ", m.group("y")).strip()})
-
-    # assist to
-    m = re.match(rf"^\s*(?P<x>{name_pat})\s+assists?\s+to\s+(?P<y>{name_pat})\s*$", s)
-    if m:
-        return ("assist_to", {
-            "x": re.sub(r"\s+", " ", m.group("x")).strip(),
-            "y": re.sub(r"\s+", " ", m.group("y")).strip()
-        })
-
-    # "x (turn|turnover|completed|completion) to y"  (result before "to")
-    m = re.match(
-        rf"^\s*(?P<x>{name_pat})\s+(?P<r>completed|complete|completion|turn|turnover|turned)\s+(?:to|2)\s+(?P<y>{name_pat})\s*$",
-        s
-    )
-    if m:
-        return ("throw", {
-            "x": re.sub(r"\s+", " ", m.group("x")).strip(),
-            "y": re.sub(r"\s+", " ", m.group("y")).strip(),
-            "result": norm_result(m.group("r"))
-        })
-
-    # bare "x to y [result]" => throw
-    m = re.match(
-        rf"^\s*(?P<x>{name_pat})\s+(?:to|2)\s+(?P<y>{name_pat})(?:\s+(?P<r>completed|complete|completion|turn|turnover|turned))?\s*$",
-        s
-    )
-    if m:
-        return ("throw", {
-            "x": re.sub(r"\s+", " ", m.group("x")).strip(),
-            "y": re.sub(r"\s+", " ", m.group("y")).strip(),
-            "result": norm_result(m.group("r"))
-        })
-
-    # throw with verb
-    m = re.match(
-        rf"^\s*(?P<x>{name_pat})\s+(?:threw|throw|passed?)\s+(?:to|2)\s+(?P<y>{name_pat})(?:\s+(?P<r>completed|complete|completion|turn|turnover|turned))?\s*$",
-        s
-    )
-    if m:
-        return ("throw", {
-            "x": re.sub(r"\s+", " ", m.group("x")).strip(),
-            "y": re.sub(r"\s+", " ", m.group("y")).strip(),
-            "result": norm_result(m.group("r"))
-        })
-
-    # huck
-    m = re.match(
-        rf"^\s*(?P<x>{name_pat})\s+(?:huck|hucked|hook)\s+(?:to\s+)?(?P<y>{name_pat})(?:\s+(?P<r>completed|complete|completion|turn|turnover|turned))?\s*$",
-        s
-    )
-    if m:
-        return ("huck", {
-            "x": re.sub(r"\s+", " ", m.group("x")).strip(),
-            "y": re.sub(r"\s+", " ", m.group("y")).strip(),
-            "result": norm_result(m.group("r"))
-        })
-
-    return (None, {})
+    # control words win anywhere in the utterance
+    if "UNDO" in kinds:      return ("undo", {})
+    if "NEW_GAME" in kinds:  return ("new_game", {})
+    if "NEW_POINT" in kinds: return ("new_point", {})
+
+    # "x d ..." (anything may follow the D)
+    if len(kinds) >= 2 and kinds[0] == "NAME" and kinds[1] == "D":
+        return ("d", {"x": values[0]})
+
+    hit = _COMMAND_TABLE.get(tuple(kinds))
+    if not hit:
+        return (None, {})
+    action, roles = hit
+    payload = {"result": None} if action in ("throw", "huck") else {}
+    for role, value in zip(roles, values):
+        if role == "r":
+            payload["result"] = RESULT_WORDS[value]  # scanner tokens are already lowercase
+        elif role:
+            payload[role] = value
+    return (action, payload)
 
 # ---- Recognizer helpers ----
 def ensure_model():
@@ -518,10 +688,8 @@ def ensure_model():
         _model = Model(MODEL_PATH)
     return _model
 
-def make_recognizer(roster):
-    phrases = build_grammar_phrases(roster)
-    grammar_json = json.dumps(phrases)
-    rec = KaldiRecognizer(ensure_model(), SAMPLE_RATE, grammar_json)
+def make_recognizer(index):
+    rec = KaldiRecognizer(ensure_model(), SAMPLE_RATE, grammar_json_for(index))
     rec.SetWords(False)
     return rec
 
@@ -529,24 +697,89 @@ def ensure_recognizer():
     global REC
     with LOCK:
         if REC is None:
-            REC = make_recognizer(BOOK.roster)
+            REC = make_recognizer(ROSTER_INDEX)
     return REC
 
-# ---- Broadcasting ----
-def broadcast_stats():
-    rows = [{"player": name, **stats} for name, stats in BOOK.players.items()]
-    rows.sort(key=lambda r: (r["scores"], r["assists"], r["ds"], r["completions"], r["throws"]), reverse=True)
+# Vosk results are one-field JSON objects, e.g. '{\n  "text" : "mario to jake"\n}'
+_TEXT_PREFIX = '"text"'
+_PARTIAL_PREFIX = '"partial"'
+
+def _quick_field(raw, prefix):
+    """String value after `prefix` in a Vosk result, or None if the shape is unexpected."""
+    i = raw.find(prefix)
+    if i < 0: return None
+    i += len(prefix)
+    j = raw.find('"', i)
+    if j < 0 or raw[i:j].strip() != ":": return None
+    k = raw.find('"', j + 1)
+    if k < 0: return None
+    val = raw[j + 1:k]
+    return None if "\\" in val else val
+
+def _result_field(raw, prefix, key):
+    """Fast-path _quick_field, falling back to a full JSON parse."""
+    val = _quick_field(raw, prefix)
+    if val is None:
+        val = json.loads(raw).get(key) or ""
+    return val
 
-    recent = BOOK.events[-200:]
-    recent = list(reversed(recent))  # newest first
+# ---- Broadcasting ----
+DELTA_MAX_PLAYERS = 4   # more changed players than this => send the full table
+_last_sent_seq = 0
 
-    socketio.emit("stats", {
+def _build_stats_payload():
+    """Full "stats" payload: sorted player rows + recent events (newest first)."""
+    return {
         "game": BOOK.game_no,
         "point": BOOK.point_no,
-        "players": rows,
+        "players": BOOK.rows(),
         "pairs": [],
-        "events": recent,
-    }, namespace="/")
+        "events": list(BOOK.events_tail),
+    }
+
+def broadcast_stats():
+    """
+    Emit "stats" (full table) or "stats_delta" (changed players + new events) to all clients.
+    A full emit is forced by undo/new game or a large change set.
+    """
+    global _last_sent_seq
+    full_needed, changed = BOOK.take_changes()
+    seq = BOOK._seq  # read with the changes, not after emit (which may yield)
+
+    if full_needed or len(changed) > DELTA_MAX_PLAYERS:
+        socketio.emit("stats", _build_stats_payload(), namespace="/")
+    else:
+        tail = BOOK.events_since(_last_sent_seq)
+        if not changed and not tail:
+            return  # nothing new since the last emit
+        socketio.emit("stats_delta", {
+            "type": "delta",
+            "game": BOOK.game_no,
+            "point": BOOK.point_no,
+            "changed": [{"player": n, **BOOK.players[n]} for n in changed],
+            "order": [r["player"] for r in BOOK.rows()],
+            "events_tail": tail,
+        }, namespace="/")
+    _last_sent_seq = seq
+
+def _flush_stats_after(delay):
+    global _stats_dirty, _flush_scheduled
+    eventlet.sleep(delay)
+    with _FLUSH_LOCK:
+        _flush_scheduled = False
+        if not _stats_dirty:
+            return
+        _stats_dirty = False
+        broadcast_stats()
+
+def schedule_stats_broadcast():
+    """Mark stats dirty; at most one flush is pending at a time."""
+    global _stats_dirty, _flush_scheduled
+    _stats_dirty = True
+    if _flush_scheduled:
+        return
+    _flush_scheduled = True
+    socketio.start_background_task(_flush_stats_after, STATS_FLUSH_DELAY_SEC)
 
 # ---- CSV persistence (per game folder, overall + per-point) ----
 def _ensure_game_dir(game_no: int):
@@ -574,37 +807,28 @@ def export_csvs():
         pfields = ["player","throws","completions","turnovers","drops",
                    "hucks","huck_completions","ds","assists","scores"]
         with open(overall_path_abs, "w", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=pfields)
-            w.writeheader()
-            for name, st in sorted(BOOK.players.items()):
-                w.writerow({
-                    "player": name,
-                    "throws": st["throws"],
-                    "completions": st["completions"],
-                    "turnovers": st["turnovers"],
-                    "drops": st["drops"],
-                    "hucks": st["hucks"],
-                    "huck_completions": st["huck_completions"],
-                    "ds": st["ds"],
-                    "assists": st["assists"],
-                    "scores": st["scores"],
-                })
+            w = csv.writer(f)
+            w.writerow(pfields)
+            w.writerows([name] + [st[k] for k in pfields[1:]]
+                        for name, st in sorted(BOOK.players.items()))
         written_rel.append(overall_path_rel)
 
-        # Per-point events (skip new_game/new_point)
+        # Per-point events (skip new_game/new_point), bucketed in one pass
         include_types = {"throw","huck","assist","score","d","drop"}
         efields = ["t","type","game","point","player","thrower","receiver","outcome"]
+        by_point = defaultdict(list)
+        for ev in BOOK.events:
+            if ev["type"] in include_types:
+                by_point[ev["point"]].append([ev.get(k, "") for k in efields])
 
         max_point = BOOK.point_no
         for p in range(1, max_point + 1):
-            rows = [ev for ev in BOOK.events if ev.get("point") == p and ev.get("type") in include_types]
             pt_path_abs = os.path.join(dir_abs, f"point_{p}.csv")
             pt_path_rel = f"{dir_rel}/point_{p}.csv"
             with open(pt_path_abs, "w", newline="") as f:
-                w = csv.DictWriter(f, fieldnames=efields)
-                w.writeheader()
-                for ev in rows:
-                    w.writerow({k: ev.get(k, "") for k in efields})
+                w = csv.writer(f)
+                w.writerow(efields)
+                w.writerows(by_point.get(p, ()))
             written_rel.append(pt_path_rel)
 
         logger.info(f"CSV saved to {dir_abs}: {len(written_rel)} file(s)")
@@ -628,7 +852,8 @@ def on_connect(auth=None):
     logger.info("Client connected")
     ensure_recognizer()
     socketio.emit("status", {"msg": "connected"}, to=request.sid, namespace="/")
-    broadcast_stats()
+    # Full state to the new client only; others keep getting deltas
+    socketio.emit("stats", _build_stats_payload(), to=request.sid, namespace="/")
 
 @socketio.on("disconnect")
 def on_disconnect():
@@ -638,10 +863,11 @@ def on_disconnect():
 @socketio.on("command")
 def on_command(data):
     cmd = (data or {}).get("cmd")
+    now = time.time()
     if cmd == "new_game":
-        BOOK.new_game()
+        BOOK.new_game(now=now)
     elif cmd == "new_point":
-        BOOK.new_point()  # manual => history snapshot
+        BOOK.new_point(now=now)  # manual => history snapshot
     elif cmd == "undo":
         if BOOK.undo():
             socketio.emit("status", {"msg": "Undid last action"}, to=request.sid, namespace="/")
@@ -653,89 +879,103 @@ def on_command(data):
             socketio.emit("status", {"msg": f"Saved CSVs to /data/{manifest['game_dir_rel']}"}, to=request.sid, namespace="/")
         except Exception:
             socketio.emit("status", {"msg": "Save failed (see server logs)"}, to=request.sid, namespace="/")
-    broadcast_stats()
+    schedule_stats_broadcast()
 
 @socketio.on("audio_chunk")
 def on_audio_chunk(data):
     if not data: return
-    try:
-        AUDIO_Q.put_nowait(data)
-        METRICS["chunks_enqueued"] += 1
-        qsz = AUDIO_Q.qsize()
-        if qsz > METRICS["q_max"]:
-            METRICS["q_max"] = qsz
-        METRICS["last_chunk_ts"] = time.time()
-    except Exception:
-        # queue full — drop one to stay realtime
-        try:
-            _ = AUDIO_Q.get_nowait()
-            METRICS["chunks_dropped"] += 1
-        except Exception:
-            pass
-        AUDIO_Q.put_nowait(data)
+    # over budget — oldest audio is evicted to stay realtime
+    METRICS["chunks_dropped"] += AUDIO_Q.put(data)
+    METRICS["chunks_enqueued"] += 1
+    qsz = AUDIO_Q.qsize()
+    if qsz > METRICS["q_max"]:
+        METRICS["q_max"] = qsz
+    METRICS["last_chunk_ts"] = time.time()
 
 # ---- Worker ----
 def audio_worker_loop():
     logger.info("worker: start")
     rec = ensure_recognizer()
-    name_regex = build_name_regex(BOOK.roster)
+    parser = ParserContext(ROSTER_INDEX)
 
     global LAST_PARTIAL
-    last_emit = 0.0
+    last_partial_emit = 0.0
+    last_partial_text = ""   # last partial actually sent (LAST_PARTIAL = last seen)
 
     while True:
         try:
-            chunk = AUDIO_Q.get(timeout=0.5)
+            chunks = [AUDIO_Q.get(timeout=0.5)]
         except Empty:
             eventlet.sleep(0); continue
 
+        # Drain whatever else is queued (up to one batch); never wait for more
+        size = len(chunks[0])
+        while size < AUDIO_BATCH_BYTES and not AUDIO_Q.empty():
+            try:
+                chunk = AUDIO_Q.get_nowait()
+            except Empty:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+
+        # Kaldi work runs in a native thread so the eventlet hub keeps serving sockets
         try:
-            with LOCK:
-                ok = rec.AcceptWaveform(chunk)
+            ok = tpool.execute(rec.AcceptWaveform, chunks[0] if len(chunks) == 1 else b"".join(chunks))
         except Exception:
             logger.exception("AcceptWaveform crashed")
             eventlet.sleep(0); continue
 
-        METRICS["chunks_processed"] += 1
+        METRICS["chunks_processed"] += len(chunks)
 
         if not ok:
             # Emit partial transcript to UI
             try:
-                partial = (json.loads(rec.PartialResult()).get("partial") or "").strip()
+                partial = _result_field(tpool.execute(rec.PartialResult), _PARTIAL_PREFIX, "partial").strip()
             except Exception:
                 partial = ""
-            if partial and partial != LAST_PARTIAL:
+            # Compare with the last partial *sent*, so a held-back one is retried
+            # on every later batch until the interval/idle gate lets it through
+            if partial and partial != last_partial_text:
                 LAST_PARTIAL = partial
-                socketio.emit("partial", {"text": partial}, namespace="/")
+                now = time.time()
+                gap = now - last_partial_emit
+                if gap >= PARTIAL_MIN_INTERVAL_SEC and (
+                    len(partial) - len(last_partial_text) >= PARTIAL_MIN_NEW_CHARS
+                    or gap >= PARTIAL_IDLE_SEC
+                ):
+                    socketio.emit("partial", {"text": partial}, namespace="/")
+                    last_partial_emit = now
+                    last_partial_text = partial
             eventlet.sleep(0); continue
 
         # Final result
         try:
-            res = json.loads(rec.Result())
+            text = _result_field(tpool.execute(rec.Result), _TEXT_PREFIX, "text").strip()
         except Exception:
             logger.exception("Result JSON failed")
             eventlet.sleep(0); continue
 
-        text = (res.get("text") or "").strip()
-        METRICS["last_result_ts"] = time.time()
+        now = time.time()  # one timestamp for everything this utterance applies
+        METRICS["last_result_ts"] = now
 
-        # Always tell client the final transcript
+        # Flush a held-back partial first, then always tell client the final transcript
+        if LAST_PARTIAL and LAST_PARTIAL != last_partial_text:
+            socketio.emit("partial", {"text": LAST_PARTIAL}, namespace="/")
         socketio.emit("final", {"text": text}, namespace="/")
         LAST_PARTIAL = ""
+        last_partial_text = ""
 
         if not text:
             eventlet.sleep(0); continue
 
         # Parse → action/payload
-        action, payload = parse_command(text, name_regex)
+        action, payload = parse_command(text, parser)
         if not action:
             eventlet.sleep(0); continue
 
-        # Default outcomes for throws/hucks
-        if action in ("throw", "huck"):
-            r = payload.get("result")
-            if r is None or r in ("", "complete", "completion", "completed"):
-                payload["result"] = "completed"
+        # Default outcome for throws/hucks (results arrive as "completed"/"turn")
+        if action in ("throw", "huck") and payload["result"] is None:
+            payload["result"] = "completed"
 
         # Required fields guard
         REQUIRED = {
@@ -757,23 +997,23 @@ def audio_worker_loop():
                 else:
                     socketio.emit("status", {"msg": "Nothing to undo"}, namespace="/")
             elif action == "new_game":
-                BOOK.new_game()
+                BOOK.new_game(now=now)
             elif action == "new_point":
-                BOOK.new_point()
+                BOOK.new_point(now=now)
             elif action == "d":
-                BOOK.record_d(payload["x"])
+                BOOK.record_d(payload["x"], now=now)
             elif action == "drop":
-                BOOK.record_drop(payload["x"])
+                BOOK.record_drop(payload["x"], now=now)
             elif action == "assist":
-                BOOK.record_assist(payload["x"])
+                BOOK.record_assist(payload["x"], now=now)
             elif action == "score":
-                BOOK.record_score(payload["y"])
+                BOOK.record_score(payload["y"], now=now)
             elif action == "assist_to":
-                BOOK.record_assist_to(payload["x"], payload["y"])
+                BOOK.record_assist_to(payload["x"], payload["y"], now=now)
             elif action == "throw":
-                BOOK.record_throw(payload["x"], payload["y"], payload["result"])
+                BOOK.record_throw(payload["x"], payload["y"], payload["result"], now=now)
             elif action == "huck":
-                BOOK.record_huck(payload["x"], payload["y"], payload["result"])
+                BOOK.record_huck(payload["x"], payload["y"], payload["result"], now=now)
 
             METRICS["commands_applied"] += 1
             logger.info(f"APPLIED {action} {payload}  (total={METRICS['commands_applied']})")
@@ -781,11 +1021,8 @@ def audio_worker_loop():
             logger.exception("apply_event failed")
             eventlet.sleep(0); continue
 
-        # Throttle UI refresh a bit
-        now = time.time()
-        if now - last_emit > 0.05:
-            broadcast_stats()
-            last_emit = now
+        # Debounced UI refresh
+        schedule_stats_broadcast()
 
         eventlet.sleep(0)
 
@@ -803,6 +1040,7 @@ def debug():
     return {
         "metrics": METRICS,
         "queue_size": AUDIO_Q.qsize(),
+        "queue_bytes": AUDIO_Q.nbytes,
         "roster": BOOK.roster,
         "events": len(BOOK.events),
     }
@@ -15,6 +15,14 @@ const btnGame  = document.getElementById("btn-game");
 const btnExport= document.getElementById("btn-export");
 
 const VISIBLE_EVENT_ROWS = 10; // show only the latest 10 rows
+const MAX_EVENTS = 200;         // server sends at most this many events
+
+// Last known server state; "stats_delta" payloads are applied on top of it
+let view = {
+  players: [],
+  events: [],
+  lastSeq: 0
+};
 
 let audio = {
   ctx: null,
@@ -52,10 +60,26 @@ socket.on("final", ({text}) => {
 
 socket.on("stats", (payload) => {
   if (!payload) return;
-  gameEl.textContent = payload.game;
-  pointEl.textContent = payload.point;
-  renderPlayers(payload.players || []);
-  renderEvents((payload.events || []));
+  view.players = payload.players || [];
+  view.events = payload.events || [];
+  view.lastSeq = view.events.length ? view.events[0].seq : 0;
+  renderView(payload);
+});
+
+socket.on("stats_delta", (payload) => {
+  if (!payload) return;
+  // Merge changed rows, then reorder to match the server's sort
+  const byName = new Map(view.players.map(p => [p.player, p]));
+  for (const p of (payload.changed || [])) byName.set(p.player, p);
+  view.players = (payload.order || []).map(n => byName.get(n)).filter(Boolean);
+
+  // Events are newest-first; skip any we already have
+  const fresh = (payload.events_tail || []).filter(ev => ev.seq > view.lastSeq);
+  if (fresh.length) {
+    view.events = fresh.concat(view.events).slice(0, MAX_EVENTS);
+    view.lastSeq = fresh[0].seq;
+  }
+  renderView(payload);
 });
 
 /* -------- UI buttons -------- */
@@ -67,6 +91,13 @@ btnGame.addEventListener("click", () => socket.emit("command", {cmd:"new_game"})
 btnExport.addEventListener("click", () => socket.emit("command", {cmd:"export"}));
 
 /* -------- Renderers -------- */
+function renderView(payload){
+  gameEl.textContent = payload.game;
+  pointEl.textContent = payload.point;
+  renderPlayers(view.players);
+  renderEvents(view.events);
+}
+
 function renderPlayers(players){
   const tbody = document.querySelector("#players tbody");
   tbody.innerHTML = "";